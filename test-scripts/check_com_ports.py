@@ -11,6 +11,8 @@ try:
     print("COM Port Detection Test")
     print("=" * 60)
 
+    # Always enumerate fresh - this diagnostic reports what pyserial sees
+    # right now, so it deliberately bypasses serial_bridge's port cache
     ports = list(serial.tools.list_ports.comports())
 
     if not ports:
@@ -25,19 +27,21 @@ try:
         print("- Run 'setupc' as Administrator to verify ports")
     else:
         print(f"✅ Found {len(ports)} COM port(s):\n")
-        for port in ports:
-            print(f"  Port: {port.device}")
-            print(f"  Description: {port.description}")
-            print(f"  Hardware ID: {port.hwid}")
+        # Read each port's fields once
+        port_rows = [(p.device, p.description, p.hwid) for p in ports]
+        for device, description, hwid in port_rows:
+            print(f"  Port: {device}")
+            print(f"  Description: {description}")
+            print(f"  Hardware ID: {hwid}")
             print()
 
         # Check for specific ports
-        port_names = [p.device for p in ports]
+        port_set = {device for device, _, _ in port_rows}
         expected = ['COM3', 'COM4', 'COM5', 'COM6']
 
         print("Expected com0com ports:")
         for port_name in expected:
-            status = "✅ FOUND" if port_name in port_names else "❌ MISSING"
+            status = "✅ FOUND" if port_name in port_set else "❌ MISSING"
             print(f"  {port_name}: {status}")
 
     print("=" * 60)
@@ -21,93 +21,338 @@ import argparse
 import json
 import time
 import platform
+import re
+import select
+import shutil
 import threading
+from collections import namedtuple
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-IS_WINDOWS = platform.system() == "Windows"
+# Use orjson for config parsing when it's installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _read_config = Path.read_bytes
+except ImportError:
+    _json_loads = json.loads
+    _read_config = Path.read_text
+
+PLATFORM_NAME = platform.system()
+IS_WINDOWS = PLATFORM_NAME == "Windows"
+
+# Enumerating COM ports goes through WMI/SetupAPI on Windows and can take
+# hundreds of ms, so share one result across every bridge created at startup.
+_PORT_CACHE = {"ts": 0, "names": None}
+
+# Enumeration results are also persisted across runs and reused until the
+# hardware signature changes (i.e. a port was plugged in or removed). Only
+# the Windows bridge (_check_com0com) enumerates ports, so only it uses this.
+PORT_CACHE_FILE = Path.home() / ".cache" / "healvet" / "ports.json"
+
+_COM_NAME_RE = re.compile(r"\s*\((COM\d+)\)")
+
+PortInfo = namedtuple("PortInfo", ["device", "description", "hwid"])
+
+
+def _query_wmi_ports():
+    """
+    Query WMI for COM port devices only.
+
+    Filtering on the provider side avoids walking every PnP entity, which is
+    what pyserial's generic enumeration does.
+    """
+    import win32com.client
+
+    locator = win32com.client.Dispatch("WbemScripting.SWbemLocator")
+    service = locator.ConnectServer(".", "root\\cimv2")
+    rows = service.ExecQuery(
+        "SELECT DeviceID, Name FROM Win32_PnPEntity WHERE Name LIKE '%(COM%'"
+    )
+    ports = []
+    for row in rows:
+        name = row.Name or ""
+        match = _COM_NAME_RE.search(name)
+        if match:
+            description = _COM_NAME_RE.sub("", name)
+            ports.append(PortInfo(match.group(1), description, row.DeviceID or ""))
+    return ports
+
+
+def _enumerate_ports():
+    """Enumerate available serial ports from the OS."""
+    if IS_WINDOWS:
+        try:
+            return _query_wmi_ports()
+        except Exception:
+            # pywin32 missing or WMI unavailable - use pyserial instead
+            pass
+
+    import serial.tools.list_ports
+    return [PortInfo(p.device, p.description, p.hwid) for p in serial.tools.list_ports.comports()]
+
+
+def _hardware_signature():
+    """
+    Return a cheap value that changes whenever COM ports come or go.
+
+    Only implemented for Windows, the one platform that enumerates ports.
+    Returns None elsewhere or on error, which disables the persistent cache.
+    """
+    try:
+        if IS_WINDOWS:
+            import winreg
+            # SERIALCOMM is rewritten whenever a COM port appears or disappears
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DEVICEMAP\SERIALCOMM") as key:
+                return str(winreg.QueryInfoKey(key)[2])
+    except OSError:
+        pass
+    return None
+
+
+def enumerate_ports_cached():
+    """
+    Return available serial ports as PortInfo tuples.
+
+    Uses the result persisted in PORT_CACHE_FILE when the hardware signature
+    hasn't changed since it was written, and enumerates otherwise.
+    """
+    signature = _hardware_signature()
+
+    if signature is not None:
+        try:
+            with open(PORT_CACHE_FILE) as f:
+                cached = json.load(f)
+            if cached.get("signature") == signature:
+                return [PortInfo(*row) for row in cached["ports"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    ports = _enumerate_ports()
+
+    if signature is not None:
+        try:
+            PORT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = PORT_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump({"signature": signature, "ports": [list(p) for p in ports]}, f)
+            os.replace(tmp_path, PORT_CACHE_FILE)
+        except OSError:
+            pass
+
+    return ports
+
+
+def _cached_comports(ttl=5.0):
+    """Return the set of available serial device names, cached for `ttl` seconds."""
+    now = time.monotonic()
+    if _PORT_CACHE["names"] is None or now - _PORT_CACHE["ts"] >= ttl:
+        _PORT_CACHE["names"] = frozenset(p.device for p in enumerate_ports_cached())
+        _PORT_CACHE["ts"] = now
+    return _PORT_CACHE["names"]
+
+
+class _DirWatcher:
+    """
+    Wake up when entries are created in a set of directories.
+
+    Uses inotify on Linux and kqueue on macOS so waiting for socat's symlinks
+    doesn't need a sleep loop. `available` is False when neither is usable.
+    """
+
+    _IN_CREATE = 0x00000100
+    _IN_MOVED_TO = 0x00000080
+
+    def __init__(self, directories):
+        self._fd = None
+        self._kqueue = None
+        self._dir_fds = []
+        try:
+            if sys.platform.startswith("linux"):
+                self._open_inotify(directories)
+            elif hasattr(select, "kqueue"):
+                self._open_kqueue(directories)
+        except (OSError, AttributeError):
+            self.close()
+
+    @property
+    def available(self):
+        return self._fd is not None or self._kqueue is not None
+
+    def _open_inotify(self, directories):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        # IN_NONBLOCK/IN_CLOEXEC share their values with the O_ flags; looked
+        # up here so importing on Windows never touches them
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        for directory in directories:
+            wd = libc.inotify_add_watch(fd, os.fsencode(directory), self._IN_CREATE | self._IN_MOVED_TO)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+
+    def _open_kqueue(self, directories):
+        self._kqueue = select.kqueue()
+        events = []
+        for directory in directories:
+            dir_fd = os.open(directory, os.O_RDONLY)
+            self._dir_fds.append(dir_fd)
+            events.append(select.kevent(
+                dir_fd,
+                filter=select.KQ_FILTER_VNODE,
+                flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                fflags=select.KQ_NOTE_WRITE,
+            ))
+        self._kqueue.control(events, 0, 0)
+
+    def wait(self, timeout):
+        """Block until a directory changes or `timeout` seconds pass."""
+        if self._fd is not None:
+            ready, _, _ = select.select([self._fd], [], [], timeout)
+            if ready:
+                try:
+                    os.read(self._fd, 4096)
+                except BlockingIOError:
+                    pass
+        else:
+            self._kqueue.control(None, 1, timeout)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        if self._kqueue is not None:
+            self._kqueue.close()
+            self._kqueue = None
+        for dir_fd in self._dir_fds:
+            os.close(dir_fd)
+        self._dir_fds = []
 
 
 class UnixSerialBridge:
     """Serial bridge using socat (macOS/Linux) - supports custom port names."""
 
-    def __init__(self, device_name, app_port, test_port):
+    def __init__(self, device_name, app_port, test_port, verbose=False):
         self.device_name = device_name
         self.app_port = app_port
         self.test_port = test_port
+        self.verbose = verbose
         self.socat_process = None
 
-    def create(self):
-        """Create virtual serial port pair using socat with named links."""
+    def create(self, print_lock=None):
+        """
+        Create virtual serial port pair using socat with named links.
+
+        print_lock serializes output when several bridges are created at once.
+        """
+        print_lock = print_lock or nullcontext()
         # Remove old symlinks if they exist
-        for port in [self.app_port, self.test_port]:
-            if os.path.exists(port):
-                try:
-                    os.unlink(port)
-                except:
-                    pass
+        self._remove_links()
 
         # Start socat process to create bridged port pair
+        # An absolute executable path plus close_fds=False lets CPython launch
+        # socat with posix_spawn instead of fork+exec
         cmd = [
-            "socat",
-            "-d", "-d",
+            shutil.which("socat") or "socat",
+            *(["-d", "-d"] if self.verbose else []),
             f"pty,raw,echo=0,link={self.app_port}",
             f"pty,raw,echo=0,link={self.test_port}"
         ]
 
+        # Start watching before socat runs so the symlink creation isn't missed
+        watcher = _DirWatcher({
+            os.path.dirname(os.path.abspath(port))
+            for port in (self.app_port, self.test_port)
+        })
+
         try:
+            # Nothing reads socat's output, so never hand it a pipe - a full
+            # pipe buffer would block socat and stall data forwarding.
+            # In verbose mode the log goes straight to our terminal instead.
+            output = None if self.verbose else subprocess.DEVNULL
             self.socat_process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True
+                stdout=output,
+                stderr=output,
+                close_fds=False
             )
         except FileNotFoundError:
-            print("Error: socat not found. Please install it:")
-            print("   macOS: brew install socat")
-            print("   Linux: sudo apt-get install socat")
+            watcher.close()
+            with print_lock:
+                print("Error: socat not found. Please install it:")
+                print("   macOS: brew install socat")
+                print("   Linux: sudo apt-get install socat")
             sys.exit(1)
 
         # Wait for socat to create the symlinks
         max_wait = 2
-        start = time.time()
-        while time.time() - start < max_wait:
-            if os.path.exists(self.app_port) and os.path.exists(self.test_port):
-                return
-            time.sleep(0.1)
+        deadline = time.monotonic() + max_wait
+        try:
+            while True:
+                if os.path.exists(self.app_port) and os.path.exists(self.test_port):
+                    return
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if watcher.available:
+                    watcher.wait(remaining)
+                else:
+                    time.sleep(min(0.1, remaining))
+        finally:
+            watcher.close()
 
         # Check if ports were created
         if not os.path.exists(self.app_port) or not os.path.exists(self.test_port):
-            print(f"Failed to create ports for {self.device_name}")
-            print(f"   Expected: {self.app_port} and {self.test_port}")
+            with print_lock:
+                print(f"Failed to create ports for {self.device_name}")
+                print(f"   Expected: {self.app_port} and {self.test_port}")
             self.close()
             sys.exit(1)
 
     def close(self):
         """Stop socat process and cleanup."""
         if self.socat_process:
+            # socat exits promptly on SIGINT; only escalate if it lingers
             try:
-                self.socat_process.terminate()
-                self.socat_process.wait(timeout=2)
-            except:
+                self.socat_process.send_signal(signal.SIGINT)
+                self.socat_process.wait(timeout=0.2)
+            except subprocess.TimeoutExpired:
                 try:
-                    self.socat_process.kill()
+                    self.socat_process.terminate()
+                    self.socat_process.wait(timeout=0.5)
                 except:
-                    pass
+                    try:
+                        self.socat_process.kill()
+                    except:
+                        pass
+            except:
+                pass
 
         # Cleanup symlinks
-        for port in [self.app_port, self.test_port]:
-            if os.path.exists(port):
-                try:
-                    os.unlink(port)
-                except:
-                    pass
+        self._remove_links()
+
+    def _remove_links(self):
+        """Unlink both port symlinks, ignoring ones that are already gone."""
+        for port in (self.app_port, self.test_port):
+            try:
+                os.unlink(port)
+            except OSError:
+                # FileNotFoundError included - unlinking directly avoids a
+                # separate exists() check that races with socat
+                pass
 
 
 class WindowsSerialBridge:
     """Serial bridge for Windows using Python pty fallback or com0com."""
 
-    def __init__(self, device_name, app_port, test_port):
+    def __init__(self, device_name, app_port, test_port, verbose=False):
         self.device_name = device_name
+        self.verbose = verbose
         # On Windows, we'll try to use the configured COM ports if com0com is set up
         # Otherwise, we'll create a socket-based bridge
         self.app_port = app_port
@@ -119,54 +364,66 @@ class WindowsSerialBridge:
         self._actual_app_port = None
         self._actual_test_port = None
 
-    def create(self):
+    def create(self, print_lock=None):
         """
         Create virtual serial port pair on Windows.
 
         Option 1: com0com is installed - use configured COM port pairs
         Option 2: Use socket-based bridge with pyserial's loop:// or socket://
+
+        print_lock serializes output when several bridges are created at once.
         """
+        print_lock = print_lock or nullcontext()
+
         # Check if com0com ports exist
         if self._check_com0com():
-            print(f"   Using com0com ports: {self.app_port} <-> {self.test_port}")
+            with print_lock:
+                print(f"   {self.device_name}: using com0com ports {self.app_port} <-> {self.test_port}")
             self._actual_app_port = self.app_port
             self._actual_test_port = self.test_port
             return
 
         # Fallback: Use socket-based pseudo-serial ports
         # pyserial supports socket:// URLs which we can use for testing
-        import socket
-
-        # Create a socket pair for bidirectional communication
-        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.server_socket.bind(('127.0.0.1', 0))  # Random available port
-        self.server_socket.listen(1)
-
+        self.server_socket = self._open_listener()
         server_port = self.server_socket.getsockname()[1]
 
         # Create second socket pair
-        self.client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.client_socket.bind(('127.0.0.1', 0))
-        self.client_socket.listen(1)
-
+        self.client_socket = self._open_listener()
         client_port = self.client_socket.getsockname()[1]
 
         # Use socket:// URLs that pyserial understands
         self._actual_app_port = f"socket://127.0.0.1:{server_port}"
         self._actual_test_port = f"socket://127.0.0.1:{client_port}"
 
-        print(f"   Note: com0com not found. Using socket bridge instead.")
-        print(f"   For proper COM port emulation, install com0com:")
-        print(f"   https://sourceforge.net/projects/com0com/")
+        with print_lock:
+            print(f"   {self.device_name}: com0com not found. Using socket bridge instead.")
+            print(f"   For proper COM port emulation, install com0com:")
+            print(f"   https://sourceforge.net/projects/com0com/")
+
+    @staticmethod
+    def _open_listener():
+        """
+        Open a loopback listener on a random free port.
+
+        Every listener gets its own ephemeral port, so there is no shared
+        accept queue to balance across bridges. Nothing accepts on these
+        sockets or relays between them - they only reserve the socket://
+        addresses reported to the user.
+        """
+        import socket
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(('127.0.0.1', 0))  # Random available port
+        sock.listen(1)
+        return sock
 
     def _check_com0com(self):
         """Check if the configured COM ports exist (com0com installed)."""
         try:
-            import serial.tools.list_ports
-            available = [p.device for p in serial.tools.list_ports.comports()]
-            return self.app_port in available and self.test_port in available
+            port_set = _cached_comports()
+            return self.app_port in port_set and self.test_port in port_set
         except:
             return False
 
@@ -195,8 +452,30 @@ class WindowsSerialBridge:
                 pass
 
 
+# Platform-specific pieces, bound once at import
+if IS_WINDOWS:
+    BridgeClass = WindowsSerialBridge
+    PYTHON_CMD = "python"
+
+    def get_actual_ports(bridge):
+        """Return (app_port, test_port) - may differ from config with the socket fallback."""
+        return bridge.actual_app_port, bridge.actual_test_port
+else:
+    BridgeClass = UnixSerialBridge
+    PYTHON_CMD = "python3"
+
+    def get_actual_ports(bridge):
+        """Return (app_port, test_port) as configured."""
+        return bridge.app_port, bridge.test_port
+
+
 def load_config(config_path):
-    """Load device configuration from JSON file."""
+    """
+    Load device configuration from JSON file.
+
+    Returns:
+        Tuple of (full config dict, list of serial port devices)
+    """
     if not config_path.exists():
         print(f"Error: Config file not found: {config_path}")
         print(f"\nExpected format:")
@@ -229,13 +508,12 @@ def load_config(config_path):
         print(json.dumps(example, indent=2))
         sys.exit(1)
 
-    with open(config_path) as f:
-        config = json.load(f)
+    config = _json_loads(_read_config(config_path))
 
     # Filter only serial port devices
     serial_devices = [d for d in config.get("devices", []) if d.get("connection") == "serial_port"]
 
-    return serial_devices
+    return config, serial_devices
 
 
 def get_default_ports(device_name):
@@ -253,11 +531,9 @@ def get_default_ports(device_name):
         return (f"/tmp/tty{device_name}_app", f"/tmp/tty{device_name}_test")
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Config-based serial port bridge for testing",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=f"""
+def build_epilog():
+    """Build the --help epilog (only needed when help is actually printed)."""
+    return f"""
 Examples:
   # Use default config file (device_ports.json)
   python3 serial_bridge.py
@@ -265,9 +541,9 @@ Examples:
   # Use custom config file
   python3 serial_bridge.py --config my_ports.json
 
-Platform: {platform.system()}
+Platform: {PLATFORM_NAME}
 
-Config File Format ({platform.system()}):
+Config File Format ({PLATFORM_NAME}):
 {json.dumps({
     "devices": [
         {
@@ -287,44 +563,92 @@ Config File Format ({platform.system()}):
   - Install socat: brew install socat (macOS) or apt install socat (Linux)
   - Port names can be any valid path (e.g., /tmp/ttyMyDevice)'''}
         """
+
+
+class LazyEpilogParser(argparse.ArgumentParser):
+    """ArgumentParser that builds its epilog on first use of the help text."""
+
+    def __init__(self, *args, epilog_factory=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.epilog_factory = epilog_factory
+
+    def format_help(self):
+        if self.epilog is None and self.epilog_factory is not None:
+            self.epilog = self.epilog_factory()
+        return super().format_help()
+
+
+def main():
+    parser = LazyEpilogParser(
+        description="Config-based serial port bridge for testing",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog_factory=build_epilog
     )
 
     parser.add_argument("--config", type=Path, default=Path(__file__).parent / "device_ports.json",
                         help="Path to config JSON file (default: device_ports.json)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Show socat debug output")
 
     args = parser.parse_args()
 
+    # Set by the signal handler; the main thread blocks on it until shutdown
+    stop_event = threading.Event()
+
     # Load config
-    serial_devices = load_config(args.config)
+    full_config, serial_devices = load_config(args.config)
 
     if not serial_devices:
         print("Error: No serial port devices found in config")
         sys.exit(1)
 
-    # Select bridge class based on platform
-    BridgeClass = WindowsSerialBridge if IS_WINDOWS else UnixSerialBridge
+    # Prime the port cache so all bridges share a single enumeration
+    if IS_WINDOWS:
+        try:
+            _cached_comports()
+        except Exception:
+            pass
+
+    # Create bridges concurrently - each one waits on socat/enumeration
+    # independently, so overlapping them cuts startup to the slowest bridge
+    print_lock = threading.Lock()
 
-    # Create bridges
-    bridges = []
-    for device in serial_devices:
+    def create_bridge(device):
         default_app, default_test = get_default_ports(device["name"])
         app_port = device.get("app_port", default_app)
         test_port = device.get("test_port", default_test)
 
-        print(f"Creating bridge for {device['name']}...")
-        bridge = BridgeClass(device["name"], app_port, test_port)
-        bridge.create()
-        bridges.append({
-            "bridge": bridge,
-            "config": device
-        })
+        with print_lock:
+            print(f"Creating bridge for {device['name']}...")
+        bridge = BridgeClass(device["name"], app_port, test_port, verbose=args.verbose)
+        bridge.create(print_lock)
+        return bridge
+
+    with ThreadPoolExecutor(max_workers=len(serial_devices)) as executor:
+        futures = [executor.submit(create_bridge, device) for device in serial_devices]
+        failed = [f for f in as_completed(futures) if f.exception() is not None]
+
+    if failed:
+        # One bridge failed - tear down the ones that came up
+        for future in futures:
+            if future.exception() is None:
+                future.result().close()
+        failed[0].result()
+
+    # Preserve config order for the summary
+    bridges = [
+        {"bridge": future.result(), "config": device}
+        for future, device in zip(futures, serial_devices)
+    ]
 
     # Setup signal handler for clean exit
     def signal_handler(sig, frame):
         print("\n\nShutting down bridges...")
-        for item in bridges:
-            item["bridge"].close()
+        # Close concurrently so the per-bridge wait windows overlap
+        with ThreadPoolExecutor(max_workers=len(bridges)) as executor:
+            list(executor.map(lambda item: item["bridge"].close(), bridges))
         print("All bridges closed.")
+        stop_event.set()
         sys.exit(0)
 
     signal.signal(signal.SIGINT, signal_handler)
@@ -333,7 +657,7 @@ Config File Format ({platform.system()}):
     # Print summary
     print()
     print("=" * 70)
-    print(f"Serial Port Bridge - {platform.system()}")
+    print(f"Serial Port Bridge - {PLATFORM_NAME}")
     print("=" * 70)
     print(f"Config file: {args.config}")
     print(f"Created {len(bridges)} port pair(s):\n")
@@ -343,12 +667,7 @@ Config File Format ({platform.system()}):
         config = item["config"]
 
         # Get actual ports (may differ on Windows with socket fallback)
-        if IS_WINDOWS:
-            app_port = getattr(bridge, 'actual_app_port', bridge.app_port)
-            test_port = getattr(bridge, 'actual_test_port', bridge.test_port)
-        else:
-            app_port = bridge.app_port
-            test_port = bridge.test_port
+        app_port, test_port = get_actual_ports(bridge)
 
         print(f"{i}. {bridge.device_name} ({config['type']})")
         print(f"   App Port (configure in app):  {app_port}")
@@ -361,10 +680,7 @@ Config File Format ({platform.system()}):
     print("In Settings -> Device Integrations, configure:")
     for item in bridges:
         bridge = item["bridge"]
-        if IS_WINDOWS:
-            app_port = getattr(bridge, 'actual_app_port', bridge.app_port)
-        else:
-            app_port = bridge.app_port
+        app_port, _ = get_actual_ports(bridge)
         print(f"  {bridge.device_name}: {app_port}")
     print()
 
@@ -373,28 +689,17 @@ Config File Format ({platform.system()}):
     print("=" * 70)
 
     # Build test command
-    test_cmd_parts = ["python test_devices.py" if IS_WINDOWS else "python3 test_devices.py"]
+    test_cmd_parts = [f"{PYTHON_CMD} test_devices.py"]
 
     # Check for Exigo in config
-    try:
-        all_devices = load_config(args.config)
-        # Re-read full config to check for file_watch devices
-        with open(args.config) as f:
-            full_config = json.load(f)
-        has_exigo = any(d.get("connection") == "file_watch" for d in full_config.get("devices", []))
-        if has_exigo:
-            test_cmd_parts.append("--exigo")
-    except:
-        pass
+    has_exigo = any(d.get("connection") == "file_watch" for d in full_config.get("devices", []))
+    if has_exigo:
+        test_cmd_parts.append("--exigo")
 
     for item in bridges:
         bridge = item["bridge"]
         device_type = item["config"]["type"]
-
-        if IS_WINDOWS:
-            test_port = getattr(bridge, 'actual_test_port', bridge.test_port)
-        else:
-            test_port = bridge.test_port
+        _, test_port = get_actual_ports(bridge)
 
         if "healvet" in device_type.lower():
             test_cmd_parts.append(f"--healvet {test_port}")
@@ -409,13 +714,14 @@ Config File Format ({platform.system()}):
     print("Press Ctrl+C to stop all bridges")
     print("=" * 70)
 
-    # Keep running
-    try:
-        signal.pause()
-    except AttributeError:
-        # signal.pause() not available on Windows
-        while True:
-            time.sleep(1)
+    # Keep running until signaled
+    if IS_WINDOWS:
+        # Lock waits can't be interrupted by Ctrl+C on Windows, so wake up
+        # periodically to let the signal handler run
+        while not stop_event.wait(1):
+            pass
+    else:
+        stop_event.wait()
 
 
 if __name__ == "__main__":
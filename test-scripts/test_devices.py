@@ -18,9 +18,9 @@ Usage:
 """
 
 import argparse
-import subprocess
+import importlib.util
 import sys
-import time
+import threading
 from pathlib import Path
 
 # Paths to individual test scripts
@@ -29,17 +29,54 @@ EXIGO_SCRIPT = SCRIPT_DIR / "test_exigo_file_creator.py"
 HEALVET_SCRIPT = SCRIPT_DIR / "test_healvet_full_panel.py"
 POINTCARE_SCRIPT = SCRIPT_DIR / "test_pointcare.py"
 
+# Display name and script path per device flag
+SCRIPTS = {
+    "exigo": ("Exigo", EXIGO_SCRIPT),
+    "healvet": ("Healvet", HEALVET_SCRIPT),
+    "pointcare": ("PointCare", POINTCARE_SCRIPT),
+}
+
+def load_script(script):
+    """Load a test script as a module from its path (not via sys.path)."""
+    spec = importlib.util.spec_from_file_location(script.stem, script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def run_module(script, argv):
+    """
+    Run a test script's run(argv) in this interpreter and return its exit code.
+
+    Avoids an interpreter start-up per device. The scripts report failure
+    through sys.exit, so SystemExit is translated back into a return code
+    the same way the interpreter would.
+    """
+    try:
+        module = load_script(script)
+        module.run(argv)
+        return 0
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        return 1
+    except Exception as e:
+        print(f"❌ {script.name} crashed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
 def run_exigo(patient_id="Abbi"):
     """Run Exigo file watch test"""
     print("\n" + "="*70)
     print("🔬 Running Exigo Eos Vet (CBC Hematology) - File Watch")
     print("="*70)
 
-    cmd = ["python3", str(EXIGO_SCRIPT)]
-    result = subprocess.run(cmd, capture_output=False)
+    return_code = run_module(EXIGO_SCRIPT, [])
 
-    if result.returncode != 0:
-        print(f"❌ Exigo test failed with return code {result.returncode}")
+    if return_code != 0:
+        print(f"❌ Exigo test failed with return code {return_code}")
         return False
 
     print("✅ Exigo test completed successfully")
@@ -51,11 +88,10 @@ def run_healvet(serial_port, patient_id="TESTDOG-001"):
     print(f"🔬 Running Healvet HV-FIA 3000 (Chemistry) - Serial Port")
     print("="*70)
 
-    cmd = ["python3", str(HEALVET_SCRIPT), serial_port]
-    result = subprocess.run(cmd, capture_output=False)
+    return_code = run_module(HEALVET_SCRIPT, [serial_port])
 
-    if result.returncode != 0:
-        print(f"❌ Healvet test failed with return code {result.returncode}")
+    if return_code != 0:
+        print(f"❌ Healvet test failed with return code {return_code}")
         return False
 
     print("✅ Healvet test completed successfully")
@@ -67,16 +103,19 @@ def run_pointcare(serial_port, patient_id="TESTDOG-001", test_type="55"):
     print(f"🔬 Running MNCHIP PointCare PCR V1 (Biochemistry) - Serial Port")
     print("="*70)
 
-    cmd = ["python3", str(POINTCARE_SCRIPT), serial_port, patient_id, test_type]
-    result = subprocess.run(cmd, capture_output=False)
+    return_code = run_module(POINTCARE_SCRIPT, [serial_port, patient_id, test_type])
 
-    if result.returncode != 0:
-        print(f"❌ PointCare test failed with return code {result.returncode}")
+    if return_code != 0:
+        print(f"❌ PointCare test failed with return code {return_code}")
         return False
 
     print("✅ PointCare test completed successfully")
     return True
 
+def run_in_thread(name, script, argv, return_codes):
+    """Thread target: run a test script and record its exit code under `name`."""
+    return_codes[name] = run_module(script, argv)
+
 def main():
     parser = argparse.ArgumentParser(
         description="Test veterinary lab device simulators",
@@ -133,12 +172,11 @@ Options:
         print("\n❌ Error: Please specify at least one device to test")
         sys.exit(1)
 
-    # Check if individual scripts exist
-    for script, name in [
-        (EXIGO_SCRIPT, "Exigo"),
-        (HEALVET_SCRIPT, "Healvet"),
-        (POINTCARE_SCRIPT, "PointCare")
-    ]:
+    # Check that the scripts for the selected devices exist
+    for key, selected in [("exigo", args.exigo), ("healvet", args.healvet), ("pointcare", args.pointcare)]:
+        if not selected:
+            continue
+        name, script = SCRIPTS[key]
         if not script.exists():
             print(f"❌ Error: {name} test script not found: {script}")
             sys.exit(1)
@@ -169,29 +207,36 @@ Options:
 
     # Run tests
     if args.parallel:
-        # Parallel execution using subprocess.Popen
+        # Parallel execution in threads of this interpreter - the simulators
+        # are I/O-bound, so this avoids a cold interpreter start per device
         print("\n🚀 Starting all devices in parallel...")
-        processes = []
+        threads = []
+        return_codes = {}
 
         for name, test_func in tests:
-            # For parallel execution, we need to run scripts directly
             if name == "exigo":
-                cmd = ["python3", str(EXIGO_SCRIPT)]
+                script, argv = EXIGO_SCRIPT, []
             elif name == "healvet":
-                cmd = ["python3", str(HEALVET_SCRIPT), args.healvet]
+                script, argv = HEALVET_SCRIPT, [args.healvet]
             elif name == "pointcare":
                 patient_id = args.patient_id or "TESTDOG-001"
-                cmd = ["python3", str(POINTCARE_SCRIPT), args.pointcare, patient_id, args.test_type]
+                script, argv = POINTCARE_SCRIPT, [args.pointcare, patient_id, args.test_type]
 
             print(f"\n🔄 Starting {name.upper()}...")
-            proc = subprocess.Popen(cmd)
-            processes.append((name, proc))
-
-        # Wait for all processes to complete
+            thread = threading.Thread(
+                target=run_in_thread,
+                args=(name, script, argv, return_codes),
+                name=name
+            )
+            thread.start()
+            threads.append((name, thread))
+
+        # Wait for all threads to complete
         print("\n⏳ Waiting for all devices to complete...")
         results = {}
-        for name, proc in processes:
-            return_code = proc.wait()
+        for name, thread in threads:
+            thread.join()
+            return_code = return_codes.get(name, 1)
             results[name] = return_code == 0
             status = "✅ SUCCESS" if results[name] else f"❌ FAILED (code: {return_code})"
             print(f"   {name.upper()}: {status}")
@@ -224,10 +269,6 @@ Options:
             if not success:
                 print(f"\n⚠️  {name.upper()} failed, continuing with remaining tests...")
 
-            # Small delay between sequential tests
-            if len(tests) > 1:
-                time.sleep(1)
-
         # Print final summary
         print("\n" + "="*70)
         print("📊 SEQUENTIAL TEST RESULTS")
@@ -18,19 +18,33 @@ Usage:
 
     # Custom target directory
     python test_exigo_file_creator.py /path/to/source.xml /custom/watch/dir
+
+    # Hard-link instead of copy (versioned files then share the source's inode)
+    python test_exigo_file_creator.py --link --count 100 --interval 0
 """
 
+import errno
+import functools
 import os
+import re
 import sys
 import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-import platform
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+@functools.lru_cache(maxsize=None)
 def get_script_directory():
     """Get the directory where this script is located."""
     return Path(__file__).parent
 
+@functools.lru_cache(maxsize=None)
 def get_default_source_file():
     """
     Get the default source XML file (exigo_test_proper.xml in test-scripts folder).
@@ -40,26 +54,17 @@ def get_default_source_file():
     """
     return get_script_directory() / "exigo_test_proper.xml"
 
+@functools.lru_cache(maxsize=None)
 def get_default_watch_directory():
     """
     Get the default file watch directory (Desktop/filewatch).
-    Works cross-platform (macOS, Windows, Linux).
+    Works cross-platform (macOS, Windows, Linux) - the Desktop folder
+    lives directly under the home directory on all of them.
 
     Returns:
         Path to Desktop/filewatch directory
     """
-    home = Path.home()
-
-    # Desktop location varies by OS
-    if platform.system() == "Windows":
-        desktop = home / "Desktop"
-    elif platform.system() == "Darwin":  # macOS
-        desktop = home / "Desktop"
-    else:  # Linux and others
-        desktop = home / "Desktop"
-
-    # Return Desktop/filewatch
-    return desktop / "filewatch"
+    return Path.home() / "Desktop" / "filewatch"
 
 def get_next_version(directory, base_name):
     """
@@ -72,27 +77,121 @@ def get_next_version(directory, base_name):
     Returns:
         Next version number
     """
-    max_version = 0
-
     if not os.path.exists(directory):
         return 1
 
-    for filename in os.listdir(directory):
-        # Look for pattern: base_name_vNN.xml
-        if filename.startswith(base_name) and filename.endswith('.xml'):
-            # Extract version number
-            try:
-                # Format: exigo_test_proper_v46.xml
-                version_part = filename.replace(base_name, '').replace('.xml', '')
-                if version_part.startswith('_v'):
-                    version_num = int(version_part[2:])  # Skip '_v'
-                    max_version = max(max_version, version_num)
-            except ValueError:
-                continue
+    # Format: exigo_test_proper_v46.xml
+    pattern = re.compile(rf"{re.escape(base_name)}_v(\d+)\.xml\Z")
+
+    with os.scandir(directory) as entries:
+        max_version = max(
+            (int(m.group(1)) for m in map(pattern.match, (e.name for e in entries)) if m),
+            default=0
+        )
 
     return max_version + 1
 
-def create_versioned_file(source_file, target_directory, version=None):
+def _lock_file(fd):
+    """Take an exclusive lock on an open file (released when the fd is closed)."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+def _next_version_cached(directory, base_name, version=None, count=1):
+    """
+    Reserve version numbers using a counter file in the directory.
+
+    The counter (.<base_name>.counter) holds the last version used, so the
+    next one is found without listing the directory. The directory is only
+    scanned when the counter doesn't exist yet.
+
+    Args:
+        directory: Directory containing the versioned files
+        base_name: Base filename without extension
+        version: Version being written explicitly, or None to take the next one
+        count: Number of consecutive versions to reserve
+
+    Returns:
+        The (first) version number to use
+    """
+    counter_path = os.path.join(directory, f".{base_name}.counter")
+    fd = os.open(counter_path, os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        _lock_file(fd)
+        try:
+            last_version = int(os.read(fd, 32))
+        except ValueError:
+            # New or unreadable counter - derive it from the directory once
+            last_version = get_next_version(directory, base_name) - 1
+
+        if version is None:
+            version = last_version + 1
+
+        last_reserved = version + count - 1
+        if last_reserved > last_version:
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, str(last_reserved).encode('ascii'))
+    finally:
+        os.close(fd)
+
+    return version
+
+# Smallest --count (with --interval 0) that is worth copying in parallel
+PARALLEL_MIN_COUNT = 10
+
+# Directories already created/checked by this process
+_dirs_seen = set()
+
+def ensure_directory(directory):
+    """Create the directory if needed, only touching the filesystem once per path."""
+    if directory not in _dirs_seen:
+        os.makedirs(directory, exist_ok=True)
+        _dirs_seen.add(directory)
+
+# Errors from os.link that mean "linking isn't possible here, copy instead"
+_LINK_FALLBACK_ERRNOS = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP}
+
+def _place_file(source_file, target_path, link=False):
+    """
+    Put the contents of source_file at target_path, replacing any existing file.
+
+    A copy is written straight to target_path, so the watcher sees the same
+    create-then-write sequence a real Exigo export produces. Any existing
+    target is unlinked first; if it is a hard link left by an earlier --link
+    run, copying over it would otherwise write through to the fixture.
+
+    With link=True the target is a hard link to the source: no data is
+    copied, but the target IS the source file, so editing a versioned file
+    edits the fixture in the repo. The link is made under a temporary
+    (non-.xml) name and moved into place with os.replace. Falls back to a
+    copy when the filesystem can't link (different device, no privilege,
+    link limit).
+    """
+    if link:
+        tmp_path = f"{target_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.link(source_file, tmp_path)
+            os.replace(tmp_path, target_path)
+            return
+        except OSError as e:
+            if e.errno not in _LINK_FALLBACK_ERRNOS:
+                raise
+        finally:
+            # Normally gone after os.replace, but rename() is a no-op (leaving
+            # tmp_path behind) when the target is already a link to the source
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+
+    try:
+        os.unlink(target_path)
+    except FileNotFoundError:
+        pass
+    # copyfile skips the metadata copy2 preserves and can use sendfile
+    shutil.copyfile(source_file, target_path)
+
+def create_versioned_file(source_file, target_directory, version=None, link=False):
     """
     Copy source file to target directory with version number.
 
@@ -100,6 +199,7 @@ def create_versioned_file(source_file, target_directory, version=None):
         source_file: Path to source XML file
         target_directory: Directory to copy to
         version: Specific version number, or None to auto-increment
+        link: Hard-link instead of copying (see _place_file)
 
     Returns:
         Path to created file
@@ -110,25 +210,75 @@ def create_versioned_file(source_file, target_directory, version=None):
         raise FileNotFoundError(f"Source file not found: {source_file}")
 
     # Create target directory if it doesn't exist
-    os.makedirs(target_directory, exist_ok=True)
+    ensure_directory(target_directory)
 
     # Get base name without extension
     base_name = source_path.stem  # e.g., 'exigo_test_proper'
 
-    # Determine version number
-    if version is None:
-        version = get_next_version(target_directory, base_name)
+    # Determine version number (explicit versions still advance the counter)
+    version = _next_version_cached(target_directory, base_name, version)
+
+    return _write_version(source_file, target_directory, base_name, version, link)
+
+def _write_version(source_file, target_directory, base_name, version, link=False):
+    """
+    Write one versioned file for an already-reserved version number.
 
-    # Create target filename
+    Doesn't touch the version counter, so callers that reserved a block of
+    versions can write them concurrently without contending on its lock.
+
+    Returns:
+        (target_path, version)
+    """
     target_filename = f"{base_name}_v{version}.xml"
     target_path = os.path.join(target_directory, target_filename)
 
-    # Copy the file
-    shutil.copy2(source_file, target_path)
+    _place_file(source_file, target_path, link)
 
     return target_path, version
 
-def main():
+def create_versioned_files_parallel(source_file, target_directory, count, start_version=None, max_workers=8, link=False):
+    """
+    Create `count` versioned copies concurrently.
+
+    Versions are reserved up front so the copies are independent; each one
+    is I/O-bound, so a small thread pool keeps several writes in flight.
+
+    Args:
+        source_file: Path to source XML file
+        target_directory: Directory to copy to
+        count: Number of files to create
+        start_version: First version number, or None to auto-increment
+        max_workers: Maximum number of concurrent copies
+        link: Hard-link instead of copying (see _place_file)
+
+    Yields:
+        (target_path, version) tuples in completion order
+    """
+    source_path = Path(source_file)
+
+    if not source_path.exists():
+        raise FileNotFoundError(f"Source file not found: {source_file}")
+
+    ensure_directory(target_directory)
+    base_name = source_path.stem
+    first_version = _next_version_cached(target_directory, base_name, start_version, count)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, count)) as executor:
+        futures = [
+            executor.submit(_write_version, source_file, target_directory, base_name, first_version + i, link)
+            for i in range(count)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+def run(argv=None):
+    """
+    Run the file creator with command-line style arguments.
+
+    Args:
+        argv: Argument list without the program name (default: sys.argv[1:])
+    """
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -156,13 +306,19 @@ def main():
         default=1.0,
         help='Interval between files in seconds (default: 1.0)'
     )
+    parser.add_argument(
+        '--link',
+        action='store_true',
+        help='Hard-link files instead of copying (faster, but every versioned file '
+             'is then the source file - editing one edits the source)'
+    )
     parser.add_argument(
         '--start-version',
         type=int,
         help='Starting version number (default: auto-detect next)'
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Use default source file if not specified
     source_file = args.source if args.source else str(get_default_source_file())
@@ -179,25 +335,43 @@ def main():
         print(f"Count: {args.count}")
         print(f"{'='*70}\n")
 
+        ensure_directory(target_dir)
+
         current_version = args.start_version
 
-        for i in range(args.count):
-            target_path, version = create_versioned_file(
-                source_file,
-                target_dir,
-                current_version
+        # Without an interval there is nothing to pace, so bulk runs copy in parallel
+        if args.interval <= 0 and args.count >= PARALLEL_MIN_COUNT:
+            created = create_versioned_files_parallel(
+                source_file, target_dir, args.count, current_version, link=args.link
             )
-
-            print(f"✅ [{i+1}/{args.count}] Created: {os.path.basename(target_path)} (v{version})")
-
-            if current_version is None:
-                current_version = version + 1
-            else:
-                current_version += 1
-
-            # Wait before creating next file (except on last iteration)
-            if i < args.count - 1:
-                time.sleep(args.interval)
+            for i, (target_path, version) in enumerate(created):
+                print(f"✅ [{i+1}/{args.count}] Created: {os.path.basename(target_path)} (v{version})")
+        else:
+            # Files are scheduled against a fixed start time so the time spent
+            # creating each one doesn't add drift to the interval
+            start_time = time.monotonic()
+
+            for i in range(args.count):
+                target_path, version = create_versioned_file(
+                    source_file,
+                    target_dir,
+                    current_version,
+                    link=args.link
+                )
+
+                print(f"✅ [{i+1}/{args.count}] Created: {os.path.basename(target_path)} (v{version})")
+
+                if current_version is None:
+                    current_version = version + 1
+                else:
+                    current_version += 1
+
+                # Wait before creating next file (except on last iteration)
+                if i < args.count - 1:
+                    next_deadline = start_time + (i + 1) * args.interval
+                    to_sleep = next_deadline - time.monotonic()
+                    if to_sleep > 0:
+                        time.sleep(to_sleep)
 
         print(f"\n{'='*70}")
         print(f"✅ Successfully created {args.count} file(s)")
@@ -210,5 +384,8 @@ def main():
         print(f"❌ Unexpected error: {e}")
         sys.exit(1)
 
+def main():
+    run(sys.argv[1:])
+
 if __name__ == "__main__":
     main()
@@ -18,7 +18,6 @@ Example:
 import sys
 import serial
 import time
-from datetime import datetime
 
 # Healvet chemistry panel test data
 # Format: (parameter_code, result_value, unit)
@@ -31,6 +30,10 @@ CHEMISTRY_PANEL = [
     ("SAA", "3.1", "mg/L"),             # Serum Amyloid A (normal: 0-5.4 for dogs)
 ]
 
+# Constant parts of each panel message, built once:
+# ("&RESULT&", "&&PARAM_CODE&") around the per-call DATETIME
+_PANEL_PARTIALS = [(f"&{result}&", f"&&{param_code}&") for param_code, result, _ in CHEMISTRY_PANEL]
+
 def generate_healvet_message(sample_id, result, datetime_str, param_code, patient_id, gender="M", sample_type="1"):
     """
     Generate a Healvet protocol message.
@@ -88,38 +91,48 @@ def send_chemistry_panel(port_name, patient_id="TESTDOG-001", delay_between_test
             timeout=1
         )
 
+        # Enlarge the driver TX buffer so the whole message fits without
+        # waiting for drain (Windows only - POSIX ports have no equivalent)
+        try:
+            ser.set_buffer_size(rx_size=8192, tx_size=65536)
+        except AttributeError:
+            pass
+
         print(f"✅ Serial port opened: {port_name}")
         print()
 
         # Generate base sample ID (will increment for each test)
-        base_sample_id = int(datetime.now().timestamp() * 1000) % 1000000
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        # Both come from a single clock read; the timestamp is YYYYMMDDHHMMSS
+        now = time.time()
+        base_sample_id = int(now * 1000) % 1000000
+        lt = time.localtime(now)
+        timestamp = f"{lt.tm_year:04d}{lt.tm_mon:02d}{lt.tm_mday:02d}{lt.tm_hour:02d}{lt.tm_min:02d}{lt.tm_sec:02d}"
 
         # Build complete transmission: All #AFS1000 messages concatenated, ending with single EE
-        complete_transmission = ""
-
         print("📦 Building complete chemistry panel transmission...")
-        for idx, (param_code, result, unit) in enumerate(CHEMISTRY_PANEL, 1):
-            # Generate unique sample ID for this test
-            sample_id = f"{base_sample_id + idx:06d}"
+        chunks = [
+            # Message WITHOUT the EE marker (we'll add ONE at the end),
+            # with a unique sample ID for this test
+            f"#AFS1000&{base_sample_id + idx:06d}{result_part}{timestamp}{param_part}{patient_id}&&M&1".encode('utf-8')
+            for idx, (result_part, param_part) in enumerate(_PANEL_PARTIALS, 1)
+        ]
 
-            # Generate message WITHOUT the EE marker (we'll add ONE at the end)
-            message = f"#AFS1000&{sample_id}&{result}&{timestamp}&&{param_code}&{patient_id}&&M&1"
-
-            complete_transmission += message
+        for idx, (param_code, result, unit) in enumerate(CHEMISTRY_PANEL, 1):
             print(f"   {idx}. {param_code} = {result} {unit}")
 
         # Add single EE marker at the very end
-        complete_transmission += "&EE"
+        chunks.append(b"&EE")
 
+        # Joined once; the same buffer is previewed and sent
+        complete_transmission = b"".join(chunks)
         print()
         print(f"📤 Sending complete panel ({len(complete_transmission)} bytes)...")
-        print(f"   First 100 chars: {complete_transmission[:100]}...")
-        print(f"   Last 100 chars: ...{complete_transmission[-100:]}")
+        print(f"   First 100 chars: {complete_transmission[:100].decode('utf-8')}...")
+        print(f"   Last 100 chars: ...{complete_transmission[-100:].decode('utf-8')}")
         print()
 
         # Send entire transmission at once (like the real device)
-        ser.write(complete_transmission.encode('utf-8'))
+        ser.write(complete_transmission)
         ser.flush()
 
         print("✅ Transmission complete!")
@@ -144,15 +157,24 @@ def send_chemistry_panel(port_name, patient_id="TESTDOG-001", delay_between_test
         print("\n\n⚠️  Interrupted by user")
         sys.exit(0)
 
-def main():
-    if len(sys.argv) < 2:
+def run(argv):
+    """
+    Run the simulator with command-line style arguments.
+
+    Args:
+        argv: Argument list without the program name: [serial_port, patient_id]
+    """
+    if len(argv) < 1:
         print(__doc__)
         sys.exit(1)
 
-    port_name = sys.argv[1]
-    patient_id = sys.argv[2] if len(sys.argv) > 2 else "TESTDOG-001"
+    port_name = argv[0]
+    patient_id = argv[1] if len(argv) > 1 else "TESTDOG-001"
 
     send_chemistry_panel(port_name, patient_id)
 
+def main():
+    run(sys.argv[1:])
+
 if __name__ == "__main__":
     main()
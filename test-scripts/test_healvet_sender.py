@@ -9,11 +9,10 @@ Usage:
 
 import serial
 import sys
-import time
 from datetime import datetime
 
 def generate_healvet_sample(sample_id="12345", result="15.4", param_code="T4-1",
-                           patient_id="PET001", gender="M", sample_type="1"):
+                           patient_id="PET001", gender="M", sample_type="1", datetime_str=None):
     """
     Generate a valid Healvet data packet.
 
@@ -31,8 +30,10 @@ def generate_healvet_sample(sample_id="12345", result="15.4", param_code="T4-1",
     - gender: M or F
     - sample_type: Sample type code (1, 2, etc.)
     - EE: End marker (two E's)
+
+    datetime_str defaults to the current time.
     """
-    current_time = datetime.now().strftime("%Y%m%d%H%M%S")
+    current_time = datetime_str or datetime.now().strftime("%Y%m%d%H%M%S")
 
     packet = (
         f"#AFS1000"
@@ -99,6 +100,15 @@ TEST_SAMPLES = [
     }
 ]
 
+# Packets for TEST_SAMPLES with everything but the datetime filled in
+_PACKET_TEMPLATES = [
+    generate_healvet_sample(
+        **{k: v for k, v in sample.items() if k != 'name'},
+        datetime_str="{ts}"
+    )
+    for sample in TEST_SAMPLES
+]
+
 def send_healvet_data(port_name, sample_index=0):
     """Send a Healvet data packet to the specified serial port."""
 
@@ -112,7 +122,7 @@ def send_healvet_data(port_name, sample_index=0):
         port = serial.Serial(port_name, 9600, timeout=1)
 
         # Generate the data packet
-        packet = generate_healvet_sample(**{k: v for k, v in sample.items() if k != 'name'})
+        packet = _PACKET_TEMPLATES[sample_index].format(ts=datetime.now().strftime("%Y%m%d%H%M%S"))
 
         print(f"\n{'='*70}")
         print(f"Sending: {sample['name']}")
@@ -130,7 +140,7 @@ def send_healvet_data(port_name, sample_index=0):
 
         print(f"✅ Data sent successfully to {port_name}")
 
-        time.sleep(0.1)
+        # flush() already waits for the output to drain (tcdrain on POSIX)
         port.close()
 
         return True
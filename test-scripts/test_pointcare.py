@@ -5,10 +5,50 @@ Sends HL7 v2.x formatted messages over serial port
 Based on print-app PointcareSerialPortDataListener and PointcareParser
 """
 
+import os
 import serial
 import sys
 import time
-from datetime import datetime
+
+# OBX: Observation Results (16 parameters for general profile)
+# Format: OBX|examinedItemNum||paramCode|result|unit|ranges|indicator
+# Fields: [0]OBX | [1]examinedItemNum | [4]paramCode | [5]result | [6]unit | [7]ranges | [8]indicator
+# Indicators: N=Normal, L=Low, H=High
+
+# Real production data from MNCHIP PointCare Chemistry Analyzer (24 parameters)
+# Extracted from prod_files/raw_COM5.log
+PARAMETERS = [
+    ("1", "TP", "7.3", "g/dL", "5.2-8.2", "N"),           # Total Protein
+    ("2", "ALB", "3.6", "g/dL", "2.2-4.4", "N"),          # Albumin
+    ("3", "GLO", "3.7", "g/dL", "2.3-5.2", "N"),          # Globulin
+    ("4", "A/G", "1.0", " ", "0-0", "N"),                 # Albumin/Globulin ratio
+    ("5", "TBIL", "0.27", "mg/dL", "0.1-0.9", "N"),       # Total Bilirubin
+    ("6", "AST", "66", "U/L", "8.9-55", "H"),             # Aspartate Aminotransferase (HIGH)
+    ("7", "ALT", "85", "U/L", "10-140", "N"),             # Alanine Aminotransferase
+    ("8", "AST/ALT", "0.78", " ", "0-0", "N"),            # AST/ALT ratio
+    ("9", "GGT", "0.8", "U/L", "0-7", "N"),               # Gamma-Glutamyl Transferase
+    ("10", "ALP", "44", "U/L", "20-150", "N"),            # Alkaline Phosphatase
+    ("11", "TBA", "22.7", "umol/L", "0-20", "H"),         # Total Bile Acids (HIGH)
+    ("12", "BUN", "17.7", "mg/dL", "7-32", "N"),          # Blood Urea Nitrogen
+    ("13", "CRE", "0.84", "mg/dL", "0.3-1.7", "N"),       # Creatinine
+    ("14", "BUN/CRE", "21", " ", "0-0", "N"),             # BUN/Creatinine ratio
+    ("15", "CK", "373", "U/L", "20-200", "H"),            # Creatine Kinase (HIGH)
+    ("16", "AMY", "656", "U/L", "200-1800", "N"),         # Amylase
+    ("17", "GLU", "121", "mg/dL", "70-142", "N"),         # Glucose
+    ("18", "CHOL", "274", "mg/dL", "110-320", "N"),       # Cholesterol
+    ("19", "TG", "88.9", "mg/dL", "8.8-79.7", "H"),       # Triglycerides (HIGH)
+    ("20", "tCO2", "18", "mmol/L", "12-27", "N"),         # Total CO2
+    ("21", "Ca", "10.2", "mg/dL", "7.9-11.8", "N"),       # Calcium
+    ("22", "P", "3.21", "mg/dL", "2.5-6.8", "N"),         # Phosphorus
+    ("23", "Ca*P", "33", "mg/dL", "0-0", "N"),            # Calcium-Phosphorus product
+    ("24", "Mg", "1.95", "mg/dL", "1.5-2.6", "N"),        # Magnesium
+]
+
+# The OBX results never vary between messages, so build the segments once
+_OBX_BLOCK = "".join(
+    f"OBX|{exam_num}|||{param_code}|{result}|{unit}|{ranges}|{indicator}\r"
+    for exam_num, param_code, result, unit, ranges, indicator in PARAMETERS
+)
 
 def create_hl7_message(patient_id="DOG123", sample_id="PC001", test_type="55"):
     """
@@ -29,7 +69,8 @@ def create_hl7_message(patient_id="DOG123", sample_id="PC001", test_type="55"):
     """
 
     # Current timestamp in HL7 format: YYYYMMDDHHmmss
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    lt = time.localtime()
+    timestamp = f"{lt.tm_year:04d}{lt.tm_mon:02d}{lt.tm_mday:02d}{lt.tm_hour:02d}{lt.tm_min:02d}{lt.tm_sec:02d}"
 
     # MSH: Message Header
     msh = "MSH|^~\\&|PointCare|MNCHIP|||20251125143000||ORU^R01|MSG001|P|2.3\r"
@@ -45,48 +86,8 @@ def create_hl7_message(patient_id="DOG123", sample_id="PC001", test_type="55"):
     # Sample types: 1=Whole Blood, 2=Serum, 3=Plasma
     obr = f"OBR|||||||{timestamp}||||||||2|||||||||||||||||{test_type}\r"
 
-    # OBX: Observation Results (16 parameters for general profile)
-    # Format: OBX|examinedItemNum||paramCode|result|unit|ranges|indicator
-    # Fields: [0]OBX | [1]examinedItemNum | [4]paramCode | [5]result | [6]unit | [7]ranges | [8]indicator
-    # Indicators: N=Normal, L=Low, H=High
-
-    # Real production data from MNCHIP PointCare Chemistry Analyzer (24 parameters)
-    # Extracted from prod_files/raw_COM5.log
-    parameters = [
-        ("1", "TP", "7.3", "g/dL", "5.2-8.2", "N"),           # Total Protein
-        ("2", "ALB", "3.6", "g/dL", "2.2-4.4", "N"),          # Albumin
-        ("3", "GLO", "3.7", "g/dL", "2.3-5.2", "N"),          # Globulin
-        ("4", "A/G", "1.0", " ", "0-0", "N"),                 # Albumin/Globulin ratio
-        ("5", "TBIL", "0.27", "mg/dL", "0.1-0.9", "N"),       # Total Bilirubin
-        ("6", "AST", "66", "U/L", "8.9-55", "H"),             # Aspartate Aminotransferase (HIGH)
-        ("7", "ALT", "85", "U/L", "10-140", "N"),             # Alanine Aminotransferase
-        ("8", "AST/ALT", "0.78", " ", "0-0", "N"),            # AST/ALT ratio
-        ("9", "GGT", "0.8", "U/L", "0-7", "N"),               # Gamma-Glutamyl Transferase
-        ("10", "ALP", "44", "U/L", "20-150", "N"),            # Alkaline Phosphatase
-        ("11", "TBA", "22.7", "umol/L", "0-20", "H"),         # Total Bile Acids (HIGH)
-        ("12", "BUN", "17.7", "mg/dL", "7-32", "N"),          # Blood Urea Nitrogen
-        ("13", "CRE", "0.84", "mg/dL", "0.3-1.7", "N"),       # Creatinine
-        ("14", "BUN/CRE", "21", " ", "0-0", "N"),             # BUN/Creatinine ratio
-        ("15", "CK", "373", "U/L", "20-200", "H"),            # Creatine Kinase (HIGH)
-        ("16", "AMY", "656", "U/L", "200-1800", "N"),         # Amylase
-        ("17", "GLU", "121", "mg/dL", "70-142", "N"),         # Glucose
-        ("18", "CHOL", "274", "mg/dL", "110-320", "N"),       # Cholesterol
-        ("19", "TG", "88.9", "mg/dL", "8.8-79.7", "H"),       # Triglycerides (HIGH)
-        ("20", "tCO2", "18", "mmol/L", "12-27", "N"),         # Total CO2
-        ("21", "Ca", "10.2", "mg/dL", "7.9-11.8", "N"),       # Calcium
-        ("22", "P", "3.21", "mg/dL", "2.5-6.8", "N"),         # Phosphorus
-        ("23", "Ca*P", "33", "mg/dL", "0-0", "N"),            # Calcium-Phosphorus product
-        ("24", "Mg", "1.95", "mg/dL", "1.5-2.6", "N"),        # Magnesium
-    ]
-
-    obx_lines = []
-    for exam_num, param_code, result, unit, ranges, indicator in parameters:
-        # OBX format with pipe delimiters
-        obx = f"OBX|{exam_num}|||{param_code}|{result}|{unit}|{ranges}|{indicator}\r"
-        obx_lines.append(obx)
-
     # Combine all parts (HL7 content)
-    hl7_content = msh + pid + obr + "".join(obx_lines)
+    hl7_content = msh + pid + obr + _OBX_BLOCK
 
     # MLLP framing:
     # - Start: 0x0B (VT - Vertical Tab)
@@ -98,18 +99,54 @@ def create_hl7_message(patient_id="DOG123", sample_id="PC001", test_type="55"):
 
     return message
 
+# Device paths that are pseudo-terminals (Linux, macOS)
+PTY_PREFIXES = ("/dev/pts/", "/dev/ttys")
+
+def _is_pty_path(port):
+    """Check whether the port is (or links to) a pseudo-terminal."""
+    return os.path.realpath(port).startswith(PTY_PREFIXES)
+
+def _fast_pty_write(port, data):
+    """
+    Write data straight to a PTY.
+
+    Skips pyserial's constructor (termios probing, baud setup, buffer
+    flushes), which does nothing useful on a PTY.
+    """
+    fd = os.open(port, os.O_WRONLY | os.O_NOCTTY)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
 def send_pointcare_data(port, patient_id="DOG123", test_type="55", baud_rate=115200):
     """Send HL7 message via serial port"""
     try:
-        # Open serial port
-        ser = serial.Serial(
-            port=port,
-            baudrate=baud_rate,
-            bytesize=serial.EIGHTBITS,
-            parity=serial.PARITY_NONE,
-            stopbits=serial.STOPBITS_ONE,
-            timeout=1
-        )
+        # PTY loopbacks (socat bridge) ignore baud/line settings, so those
+        # are written directly instead of going through pyserial
+        use_pty = _is_pty_path(port)
+        ser = None
+
+        if not use_pty:
+            # Open serial port
+            ser = serial.Serial(
+                port=port,
+                baudrate=baud_rate,
+                bytesize=serial.EIGHTBITS,
+                parity=serial.PARITY_NONE,
+                stopbits=serial.STOPBITS_ONE,
+                timeout=1
+            )
+
+            # Enlarge the driver TX buffer so the whole message fits without
+            # waiting for drain (Windows only - POSIX ports have no equivalent)
+            try:
+                ser.set_buffer_size(rx_size=8192, tx_size=65536)
+            except AttributeError:
+                pass
 
         print("=" * 70)
         print("MNCHIP PointCare PCR V1 Simulator")
@@ -121,7 +158,10 @@ def send_pointcare_data(port, patient_id="DOG123", test_type="55", baud_rate=115
         print(f"Protocol: HL7 v2.x with MLLP framing (0x0B start, 0x1C 0x0D end)")
         print("=" * 70)
 
-        print(f"\n✅ Serial port opened: {port}")
+        if use_pty:
+            print(f"\n✅ Writing directly to PTY: {port}")
+        else:
+            print(f"\n✅ Serial port opened: {port}")
 
         # Generate HL7 message
         message = create_hl7_message(patient_id=patient_id, test_type=test_type)
@@ -135,29 +175,20 @@ def send_pointcare_data(port, patient_id="DOG123", test_type="55", baud_rate=115
         hl7_preview = message[1:201].replace('\r', '\\r\n   ')
         print(f"   Preview:\n   {hl7_preview}...")
 
-        # Send MLLP-framed message - can send as one block or chunk by chunk
-        # Real devices often send in chunks, let's simulate that
+        # Send the MLLP-framed message as one block - the receiver frames on
+        # 0x0B/0x1C 0x0D, so per-line writes and pauses only add latency
         encoded = message.encode('utf-8')
-
-        # Send MLLP start byte
-        ser.write(bytes([0x0B]))
-        time.sleep(0.01)
-
-        # Send HL7 content line by line (without the MLLP framing bytes)
-        hl7_content = message[1:-2]  # Remove start byte and end bytes
-        lines = hl7_content.split('\r')
-        for line in lines:
-            if line:  # Skip empty lines
-                ser.write((line + '\r').encode('utf-8'))
-                time.sleep(0.03)  # Small delay between lines
-
-        # Send MLLP end sequence (0x1C 0x0D)
-        ser.write(bytes([0x1C, 0x0D]))
+        if use_pty:
+            _fast_pty_write(port, encoded)
+        else:
+            ser.write(encoded)
+            ser.flush()
 
         print(f"\n✅ Transmission complete!")
 
         # Close serial port
-        ser.close()
+        if ser is not None:
+            ser.close()
 
         print("\n" + "=" * 70)
         print("✅ Complete! Sent HL7 message for patient", patient_id)
@@ -170,7 +201,7 @@ def send_pointcare_data(port, patient_id="DOG123", test_type="55", baud_rate=115
         print("    TP, ALB, GLO, A/G, TBIL, AST, ALT, AST/ALT, GGT, ALP, TBA, BUN,")
         print("    CRE, BUN/CRE, CK, AMY, GLU, CHOL, TG, tCO2, Ca, P, Ca*P, Mg")
 
-    except serial.SerialException as e:
+    except (serial.SerialException, OSError) as e:
         print(f"❌ Serial port error: {e}")
         sys.exit(1)
     except Exception as e:
@@ -179,8 +210,14 @@ def send_pointcare_data(port, patient_id="DOG123", test_type="55", baud_rate=115
         traceback.print_exc()
         sys.exit(1)
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
+def run(argv):
+    """
+    Run the simulator with command-line style arguments.
+
+    Args:
+        argv: Argument list without the program name: [serial_port, patient_id, test_type]
+    """
+    if len(argv) < 1:
         print("Usage: python3 test_pointcare.py <serial_port> [patient_id] [test_type]")
         print("Example: python3 test_pointcare.py /dev/ttys013 DOG123 55")
         print("\nTest Types:")
@@ -190,8 +227,11 @@ if __name__ == "__main__":
         print("  57 - Electrolytes")
         sys.exit(1)
 
-    port = sys.argv[1]
-    patient_id = sys.argv[2] if len(sys.argv) > 2 else "TESTDOG-001"
-    test_type = sys.argv[3] if len(sys.argv) > 3 else "55"
+    port = argv[0]
+    patient_id = argv[1] if len(argv) > 1 else "TESTDOG-001"
+    test_type = argv[2] if len(argv) > 2 else "55"
 
     send_pointcare_data(port, patient_id, test_type)
+
+if __name__ == "__main__":
+    run(sys.argv[1:])